@@ -1,18 +1,42 @@
 import os
 import json
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import time
 import threading
 import queue
 import random
+import functools
+import hashlib
+import concurrent.futures
 import tkinter as tk
 from tkinter import ttk, messagebox
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # --- Absolute Path Configuration ---
 BASE_DIR = os.path.dirname(os.path.abspath(__file__))
 CONFIG_FILE = os.path.join(BASE_DIR, "config.json")
 CONTENT_DIR = os.path.join(BASE_DIR, "organized_content")
 SETTINGS_FILE = os.path.join(BASE_DIR, "settings.json")
+QUESTIONS_CACHE_DIR = os.path.join(BASE_DIR, "questions_cache")
+
+_DECODER = json.JSONDecoder()
+
+if orjson is not None:
+    _loads = orjson.loads
+
+    def _dumps(obj):
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+else:
+    _loads = json.loads
+
+    def _dumps(obj):
+        return json.dumps(obj, indent=2).encode("utf-8")
 
 # --- Backend Logic ---
 
@@ -23,39 +47,103 @@ def load_config():
         config = json.load(f)
     if not all(k in config for k in ["api_key", "model_name", "context_window"]):
         return None, "Config missing 'api_key', 'model_name', or 'context_window'."
+    max_parallel = config.get("max_parallel", 5)
+    if isinstance(max_parallel, bool) or not isinstance(max_parallel, int) or max_parallel < 1:
+        return None, "Config 'max_parallel' must be a positive integer."
     return config, None
 
 def load_topics_data():
-    topics_data = {}
+    # Only the section names are listed up front; each section's topics are
+    # filled in by load_section_topics the first time it is selected.
     if not os.path.isdir(CONTENT_DIR):
         return None, f"Content directory not found at: {CONTENT_DIR}"
-    for section_name in sorted(os.listdir(CONTENT_DIR)):
-        section_path = os.path.join(CONTENT_DIR, section_name)
-        if os.path.isdir(section_path):
-            topics_data[section_name] = {
-                topic_file.replace(".txt", "").replace("_", " "): os.path.join(
-                    section_path, topic_file
-                )
-                for topic_file in sorted(os.listdir(section_path))
-                if topic_file.endswith(".txt")
-            }
-    return topics_data, None
+    with os.scandir(CONTENT_DIR) as entries:
+        section_names = sorted(e.name for e in entries if e.is_dir())
+    return {name: None for name in section_names}, None
+
+def load_section_topics(section_name):
+    section_path = os.path.join(CONTENT_DIR, section_name)
+    with os.scandir(section_path) as topic_files:
+        topic_entries = sorted(
+            (e for e in topic_files if e.name.endswith(".txt")), key=lambda e: e.name
+        )
+    # Each topic maps to (path, approx_tokens); ~4 bytes per token is close enough for cost estimates.
+    return {
+        e.name.replace(".txt", "").replace("_", " "): (e.path, e.stat().st_size // 4)
+        for e in topic_entries
+    }
 
-def get_detailed_system_prompt(num_questions=1, question_type="single correct answer"):
-    question_count_str = (
-        f"exactly {num_questions}" if num_questions > 1 else "exactly one"
+def save_settings(settings):
+    # Write to a temporary file and swap it in, so a crash never leaves a truncated settings file.
+    tmp_path = SETTINGS_FILE + ".tmp"
+    try:
+        with open(tmp_path, "wb") as f:
+            f.write(_dumps(settings))
+        os.replace(tmp_path, SETTINGS_FILE)
+    except OSError as e:
+        print(f"Could not save settings: {e}")
+
+class RateLimiter:
+    # Spaces request starts at least 1/rps seconds apart across all threads.
+    # Callers only sleep when they would otherwise exceed the rate.
+    def __init__(self, rps):
+        self.min_interval = 1 / rps if rps > 0 else 0
+        self.lock = threading.Lock()
+        self.next = 0
+
+    def acquire(self, cancel=None):
+        # If `cancel` (a threading.Event) is set while waiting, return early.
+        with self.lock:
+            now = time.monotonic()
+            wait = max(0, self.next - now)
+            self.next = max(now, self.next) + self.min_interval
+        if cancel is not None:
+            cancel.wait(wait)
+        else:
+            time.sleep(wait)
+
+def create_session(max_parallel):
+    session = requests.Session()
+    # Retry only when the request was never worked on: connection failures (nothing was sent),
+    # 429 (rate limited) and 503 (unavailable). Read errors and gateway errors (502/504) are not
+    # retried, since the model may already be generating, and billing, a reply.
+    retries = Retry(
+        total=3,
+        read=0,
+        other=0,
+        backoff_factor=0.3,
+        status_forcelist=[429, 503],
+        allowed_methods=frozenset(["POST"]),
     )
+    session.mount("https://", HTTPAdapter(pool_connections=10, pool_maxsize=max_parallel, max_retries=retries))
+    return session
+
+# Topic file contents keyed by path: (mtime, text)
+_FILE_CACHE = {}
+
+def read_topic(path):
+    mtime = os.stat(path).st_mtime
+    cached = _FILE_CACHE.get(path)
+    if cached is None or cached[0] != mtime:
+        with open(path, "r", encoding="utf-8") as f:
+            cached = (mtime, f.read())
+        _FILE_CACHE[path] = cached
+    return cached[1]
+
+def _build_prompt_template(batch):
     output_structure = (
         'The JSON object must have a single key "questions" which contains a list...'
-        if num_questions > 1
+        if batch
         else "The JSON object must have the structure shown below."
     )
     json_example = (
         '{\n  "questions": [\n    {\n      "question": "...",\n      "options": {...},\n      "answers": ["..."]\n    }\n  ]\n}'
-        if num_questions > 1
+        if batch
         else '{\n  "question": "...",\n  "options": {...},\n  "answers": ["..."]\n}'
     )
-    return f"""Act as an expert CompTIA exam question author. Create {question_count_str} {question_type} question(s) that mirror the style and complexity of the CompTIA Security+ 701 exam.
+    # Escape the example's braces so only {count} and {qtype} are filled in by str.format.
+    json_example = json_example.replace("{", "{{").replace("}", "}}")
+    return f"""Act as an expert CompTIA exam question author. Create {{count}} {{qtype}} question(s) that mirror the style and complexity of the CompTIA Security+ 701 exam.
 Your entire response, including the question, options, and answer, must be derived SOLELY from the provided context.
 **Question Style Guidelines:**
 1. **Scenario-Based:** Present a realistic problem a security professional might face.
@@ -65,7 +153,69 @@ Your entire response, including the question, options, and answer, must be deriv
 **Output Format:**
 Your response MUST be a single, valid JSON object without any extra text or markdown. {output_structure} The structure must be exactly as follows: {json_example}"""
 
-def generate_question_batch(context, num_questions, q_type, config):
+_PROMPT_SINGLE_TEMPLATE = _build_prompt_template(batch=False)
+_PROMPT_BATCH_TEMPLATE = _build_prompt_template(batch=True)
+
+@functools.lru_cache(maxsize=None)
+def _single_prompt(question_type):
+    return _PROMPT_SINGLE_TEMPLATE.format(count="exactly one", qtype=question_type)
+
+def get_detailed_system_prompt(num_questions=1, question_type="single correct answer"):
+    if num_questions > 1:
+        return _PROMPT_BATCH_TEMPLATE.format(count=f"exactly {num_questions}", qtype=question_type)
+    return _single_prompt(question_type)
+
+_PROMPT_TOKEN_ESTIMATE = len(get_detailed_system_prompt()) // 4
+
+# Changing either prompt template invalidates every cached question.
+_PROMPT_VERSION = hashlib.sha256((_PROMPT_SINGLE_TEMPLATE + _PROMPT_BATCH_TEMPLATE).encode("utf-8")).hexdigest()
+
+def question_cache_path(topic_path, q_type):
+    topic_mtime = os.stat(topic_path).st_mtime
+    key = f"{topic_path}{topic_mtime}{q_type}{_PROMPT_VERSION}"
+    return os.path.join(QUESTIONS_CACHE_DIR, hashlib.sha256(key.encode("utf-8")).hexdigest() + ".json")
+
+def load_cached_questions(cache_path):
+    try:
+        with open(cache_path, "rb") as f:
+            questions = _loads(f.read())["questions"]
+        os.utime(cache_path)  # Mark as recently used for LRU eviction.
+    except (OSError, ValueError, KeyError, TypeError):
+        return []
+    return questions
+
+def save_cached_questions(cache_path, questions, capacity):
+    os.makedirs(QUESTIONS_CACHE_DIR, exist_ok=True)
+    tmp_path = cache_path + ".tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(_dumps({"questions": questions}))
+    os.replace(tmp_path, cache_path)
+    # Keep only the `capacity` most recently used cache files.
+    with os.scandir(QUESTIONS_CACHE_DIR) as entries:
+        cache_files = sorted(
+            (e for e in entries if e.name.endswith(".json")),
+            key=lambda e: e.stat().st_mtime,
+            reverse=True,
+        )
+    for entry in cache_files[capacity:]:
+        os.remove(entry.path)
+
+def parse_json_object(raw_content):
+    # Fast path for replies that are nothing but the JSON object.
+    stripped = raw_content.strip()
+    if orjson is not None and stripped.startswith("{"):
+        try:
+            return orjson.loads(stripped)
+        except orjson.JSONDecodeError:
+            pass
+    # Otherwise decode the first JSON object, ignoring any surrounding text.
+    start = raw_content.find("{")
+    if start == -1:
+        raise ValueError("No JSON object in model response")
+    obj, _ = _DECODER.raw_decode(raw_content, start)
+    return obj
+
+def generate_question_batch(session, context, num_questions, q_type, config):
     system_prompt = get_detailed_system_prompt(num_questions, q_type)
     api_key, model_name, api_url = (
         config["api_key"],
@@ -83,13 +233,12 @@ def generate_question_batch(context, num_questions, q_type, config):
         "Authorization": f"Bearer {api_key}",
         "Content-Type": "application/json",
     }
-    response = requests.post(api_url, headers=headers, json=payload, timeout=120)
+    response = session.post(api_url, headers=headers, json=payload, timeout=120)
     response.raise_for_status()
-    raw_content = response.json()["choices"][0]["message"]["content"]
-    json_text = raw_content[raw_content.find("{") : raw_content.rfind("}") + 1]
-    return json.loads(json_text).get("questions", [])
+    raw_content = _loads(response.content)["choices"][0]["message"]["content"]
+    return parse_json_object(raw_content).get("questions", [])
 
-def generate_single_question(context, q_type, config):
+def generate_single_question(session, context, q_type, config):
     system_prompt = get_detailed_system_prompt(1, q_type)
     api_key, model_name, api_url = (
         config["api_key"],
@@ -107,11 +256,10 @@ def generate_single_question(context, q_type, config):
         "Authorization": f"Bearer {api_key}",
         "Content-Type": "application/json",
     }
-    response = requests.post(api_url, headers=headers, json=payload, timeout=90)
+    response = session.post(api_url, headers=headers, json=payload, timeout=90)
     response.raise_for_status()
-    raw_content = response.json()["choices"][0]["message"]["content"]
-    json_text = raw_content[raw_content.find("{") : raw_content.rfind("}") + 1]
-    return json.loads(json_text)
+    raw_content = _loads(response.content)["choices"][0]["message"]["content"]
+    return parse_json_object(raw_content)
 
 # --- GUI Application ---
 
@@ -137,15 +285,28 @@ class QuizApp:
         self.topics_data, err_topics = load_topics_data()
         if err_topics: messagebox.showerror("Content Error", err_topics); self.root.quit(); return
 
+        self.session = create_session(self.config.get("max_parallel", 5))
+
         self.questions = []
         self.user_answers = []
         self.current_question_index = 0
         self.api_queue = queue.Queue()
+        self.root.bind("<<ApiResult>>", self._handle_api_result)
+        # Worker threads can only wake the event loop with event_generate when Tcl is threaded;
+        # otherwise results are picked up by polling the queue with after().
+        self._tcl_threaded = self._is_tcl_threaded()
+        self._closing = False
+        self._poll_after_id = None
+        self._cost_after_id = None
         
         self.setup_styles()
         self.main_frame = ttk.Frame(self.root, padding=20, style="Main.TFrame")
         self.main_frame.pack(fill=tk.BOTH, expand=True)
 
+        # Each screen is built once and swapped in with pack/pack_forget.
+        self._screens = {name: ttk.Frame(self.main_frame, style="Main.TFrame") for name in ("config", "question", "results")}
+        self._current_screen = None
+
         self.setup_ui()
 
     def setup_styles(self):
@@ -168,21 +329,30 @@ class QuizApp:
         self.style.configure("TLabelFrame", background=self.BG_COLOR)
         self.style.configure("TLabelFrame.Label", background=self.BG_COLOR, font=(self.FONT_FAMILY, 11, "bold"))
 
+    def show_screen(self, name):
+        if self._current_screen is not None:
+            self._current_screen.pack_forget()
+        self._current_screen = self._screens[name]
+        self._current_screen.pack(fill=tk.BOTH, expand=True)
+
     def setup_ui(self):
-        for widget in self.main_frame.winfo_children():
-            widget.destroy()
+        if not self._screens["config"].winfo_children():
+            self.build_config_screen()
+        self.show_screen("config")
 
-        ttk.Label(self.main_frame, text="CompTIA Security+ Quiz Generator", style="Header.TLabel").pack(pady=(0, 5))
-        ttk.Label(self.main_frame, text="Configure your practice quiz below", style="Subheader.TLabel").pack(pady=(0, 20))
-        ttk.Separator(self.main_frame).pack(fill="x", pady=10)
+    def build_config_screen(self):
+        screen = self._screens["config"]
+        ttk.Label(screen, text="CompTIA Security+ Quiz Generator", style="Header.TLabel").pack(pady=(0, 5))
+        ttk.Label(screen, text="Configure your practice quiz below", style="Subheader.TLabel").pack(pady=(0, 20))
+        ttk.Separator(screen).pack(fill="x", pady=10)
 
-        controls_frame = ttk.Frame(self.main_frame, style="Main.TFrame")
+        controls_frame = ttk.Frame(screen, style="Main.TFrame")
         controls_frame.pack(fill="x", expand=True)
         
         form_grid = ttk.Frame(controls_frame, style="Main.TFrame")
         form_grid.pack(pady=10)
 
-        update_cost_callback = self.root.register(self.update_cost_estimate)
+        validate_num_callback = self.root.register(self._validate_num)
 
         ttk.Label(form_grid, text="Section:", style="Bold.TLabel").grid(row=0, column=0, sticky="w", pady=8, padx=10)
         self.section_var = tk.StringVar()
@@ -214,8 +384,10 @@ class QuizApp:
 
         ttk.Label(form_grid, text="Number of Questions:", style="Bold.TLabel").grid(row=4, column=0, sticky="w", pady=8, padx=10)
         self.num_questions_var = tk.StringVar(value="5")
-        self.num_questions_entry = ttk.Entry(form_grid, textvariable=self.num_questions_var, width=10, validate="key", validatecommand=(update_cost_callback, "%P"))
+        self.num_questions_entry = ttk.Entry(form_grid, textvariable=self.num_questions_var, width=10, validate="key", validatecommand=(validate_num_callback, "%P"))
         self.num_questions_entry.grid(row=4, column=1, sticky="w", padx=10)
+        self.num_questions_entry.bind("<KeyRelease>", self.update_cost_estimate)
+        self.num_questions_entry.bind("<FocusOut>", self.update_cost_estimate)
 
         self.manual_pricing_var = tk.BooleanVar(value=False)
         self.manual_check = ttk.Checkbutton(form_grid, text="Use Manual Pricing (to estimate cost)", variable=self.manual_pricing_var, command=self.toggle_manual_pricing, style="TCheckbutton")
@@ -239,9 +411,9 @@ class QuizApp:
         self.cost_label = ttk.Label(form_grid, text="Estimated Cost: N/A")
         self.cost_label.grid(row=7, column=1, sticky="w", padx=10, pady=5)
 
-        self.generate_button = ttk.Button(self.main_frame, text="Generate Quiz", command=self.start_generation_thread, style="Red.TButton")
+        self.generate_button = ttk.Button(screen, text="Generate Quiz", command=self.start_generation_thread, style="Red.TButton")
         self.generate_button.pack(pady=20)
-        self.status_label = ttk.Label(self.main_frame, text="")
+        self.status_label = ttk.Label(screen, text="")
         self.status_label.pack(pady=5)
 
         self.load_settings()
@@ -250,8 +422,8 @@ class QuizApp:
     def load_settings(self):
         try:
             if os.path.exists(SETTINGS_FILE):
-                with open(SETTINGS_FILE, "r") as f:
-                    settings = json.load(f)
+                with open(SETTINGS_FILE, "rb") as f:
+                    settings = _loads(f.read())
                 self.section_var.set(settings.get("section", ""))
                 self.update_topics() # Populate topics before setting the value
                 self.topic_var.set(settings.get("topic", ""))
@@ -265,6 +437,7 @@ class QuizApp:
             print(f"Could not load settings: {e}")
 
     def on_closing(self):
+        self._closing = True
         try:
             settings = {
                 "section": self.section_var.get(),
@@ -276,8 +449,8 @@ class QuizApp:
                 "manual_input": self.manual_input_price_var.get(),
                 "manual_output": self.manual_output_price_var.get(),
             }
-            with open(SETTINGS_FILE, "w") as f:
-                json.dump(settings, f, indent=2)
+            # Not a daemon thread, so the interpreter waits for the write before exiting.
+            threading.Thread(target=save_settings, args=(settings,)).start()
         except Exception as e:
             print(f"Could not save settings: {e}")
         self.root.destroy()
@@ -291,25 +464,33 @@ class QuizApp:
             self.cost_label.grid_remove()
         self.update_cost_estimate()
 
+    def _validate_num(self, proposed):
+        # Reject anything but up to four digits before it reaches the entry.
+        return proposed == "" or (proposed.isdigit() and len(proposed) <= 4)
+
     def update_cost_estimate(self, *args):
-        if not self.manual_pricing_var.get(): return True
+        if self._cost_after_id:
+            self.root.after_cancel(self._cost_after_id)
+        self._cost_after_id = self.root.after(200, self._do_update_cost_estimate)
+
+    def _do_update_cost_estimate(self):
+        self._cost_after_id = None
+        if not self.manual_pricing_var.get(): return
         try:
             topic_name = self.topic_var.get()
             num_q_str = self.num_questions_var.get()
             if not (topic_name and num_q_str):
                 self.cost_label.config(text="Estimated Cost: N/A")
-                return True
+                return
             num_q = int(num_q_str)
             input_price = float(self.manual_input_price_var.get())
             output_price = float(self.manual_output_price_var.get())
             if input_price == 0 and output_price == 0:
                 self.cost_label.config(text="Estimated Cost: $0.00 (Free Model)")
-                return True
+                return
             section = self.section_var.get()
-            topic_path = self.topics_data[section][topic_name]
-            with open(topic_path, "r", encoding="utf-8") as f:
-                context_tokens = len(f.read()) // 4
-            prompt_tokens = len(get_detailed_system_prompt()) // 4
+            _, context_tokens = self.topics_data[section][topic_name]
+            prompt_tokens = _PROMPT_TOKEN_ESTIMATE
             output_tokens_per_q = 400
             total_input_tokens, total_output_tokens = 0, 0
             if "Batch Mode" in self.mode_var.get():
@@ -324,7 +505,6 @@ class QuizApp:
             self.cost_label.config(text=f"Estimated Cost: ${total_cost:.6f}")
         except (ValueError, KeyError):
             self.cost_label.config(text="Estimated Cost: Invalid Price")
-        return True
 
     def show_mode_info(self):
         messagebox.showinfo(
@@ -342,6 +522,8 @@ class QuizApp:
     def update_topics(self, event=None):
         section = self.section_var.get()
         if section:
+            if self.topics_data[section] is None:
+                self.topics_data[section] = load_section_topics(section)
             topics = list(self.topics_data[section].keys())
             self.topic_combo["values"] = topics
             self.topic_combo.config(state="readonly")
@@ -361,7 +543,7 @@ class QuizApp:
         self.generate_button.config(state="disabled")
         self.status_label.config(text="Generating... Please wait.")
         threading.Thread(target=self.generation_worker, daemon=True).start()
-        self.check_api_queue()
+        self._poll_api_queue()
 
     def generation_worker(self):
         try:
@@ -370,27 +552,109 @@ class QuizApp:
             num_questions = int(self.num_questions_var.get())
             mode = self.mode_var.get()
             q_type_selection = self.q_type_var.get()
-            topic_path = self.topics_data[section][topic_name]
-            with open(topic_path, "r", encoding="utf-8") as f:
-                context = f.read()
-            generated_questions = []
-            if "Batch Mode" in mode:
-                q_type_for_api = "mixed single and multiple choice" if q_type_selection == "Mixed" else q_type_selection
-                generated_questions = generate_question_batch(context, num_questions, q_type_for_api, self.config)
-            else:
-                delay = self.config.get("request_delay_seconds", 1)
-                for _ in range(num_questions):
-                    q_type_for_api = random.choice(["single correct answer", "multiple correct answers"]) if q_type_selection == "Mixed" else q_type_selection
-                    q = generate_single_question(context, q_type_for_api, self.config)
-                    if q: generated_questions.append(q)
-                    time.sleep(delay)
-            self.api_queue.put(generated_questions)
+            topic_path, _ = self.topics_data[section][topic_name]
+            cache_capacity = self.config.get("question_cache_size", 50)
+            cache_path = question_cache_path(topic_path, q_type_selection) if cache_capacity > 0 else None
+            cached_questions = load_cached_questions(cache_path) if cache_path else []
+            if len(cached_questions) >= num_questions:
+                self.post_api_message(random.sample(cached_questions, num_questions))
+                return
+            context = read_topic(topic_path)
+            generated_questions = self._generate_questions(
+                context, num_questions - len(cached_questions), mode, q_type_selection, already_have=len(cached_questions)
+            )
+            if cache_path and generated_questions:
+                try:
+                    save_cached_questions(cache_path, cached_questions + generated_questions, cache_capacity)
+                except OSError as e:
+                    print(f"Could not save question cache: {e}")
+            questions = cached_questions + generated_questions
+            random.shuffle(questions)
+            self.post_api_message(questions)
         except Exception as e:
-            self.api_queue.put(e)
+            self.post_api_message(e)
+
+    def _generate_questions(self, context, num_questions, mode, q_type_selection, already_have=0):
+        # `already_have` questions came from the cache; progress is reported against the whole quiz.
+        generated_questions = []
+        # A batch of one would get the single-question prompt, which has no "questions" key,
+        # so it goes through the single-question path instead.
+        if "Batch Mode" in mode and num_questions > 1:
+            q_type_for_api = "mixed single and multiple choice" if q_type_selection == "Mixed" else q_type_selection
+            generated_questions = generate_question_batch(self.session, context, num_questions, q_type_for_api, self.config)
+        else:
+            delay = self.config.get("request_delay_seconds", 1)
+            max_parallel = self.config.get("max_parallel", 5)
+            q_types = [
+                random.choice(["single correct answer", "multiple correct answers"]) if q_type_selection == "Mixed" else q_type_selection
+                for _ in range(num_questions)
+            ]
+            limiter = RateLimiter(1 / delay if delay > 0 else 0)
+            failed = threading.Event()
+
+            def rate_limited_request(q_type_for_api):
+                limiter.acquire(cancel=failed)
+                if failed.is_set():
+                    return None
+                return generate_single_question(self.session, context, q_type_for_api, self.config)
+
+            with concurrent.futures.ThreadPoolExecutor(max_workers=max_parallel) as executor:
+                futures = [executor.submit(rate_limited_request, t) for t in q_types]
+                try:
+                    for done, future in enumerate(concurrent.futures.as_completed(futures), start=1):
+                        q = future.result()
+                        if q: generated_questions.append(q)
+                        self.post_api_message(("progress", already_have + done, already_have + num_questions))
+                except Exception:
+                    # Fail fast: don't send the remaining requests once one has failed.
+                    failed.set()
+                    for f in futures:
+                        f.cancel()
+                    raise
+        return generated_questions
+
+    def _is_tcl_threaded(self):
+        if int(self.root.tk.call("info", "tclversion").split(".")[0]) >= 9:
+            return True  # Tcl 9 is always built with thread support.
+        return bool(self.root.tk.call("info", "exists", "tcl_platform(threaded)")) and bool(
+            int(self.root.tk.getvar("tcl_platform(threaded)"))
+        )
 
-    def check_api_queue(self):
+    def post_api_message(self, message):
+        # Called from worker threads: queue the message and wake the Tk event loop.
+        self.api_queue.put(message)
+        if not self._tcl_threaded:
+            return  # _poll_api_queue picks it up.
         try:
-            result = self.api_queue.get_nowait()
+            self.root.event_generate("<<ApiResult>>", when="tail")
+        except (tk.TclError, RuntimeError) as e:
+            # Either the window was closed mid-request, or the wakeup was lost;
+            # in the latter case the slow _poll_api_queue still delivers the message.
+            if not self._closing:
+                print(f"Could not signal API result: {e}")
+
+    def _poll_api_queue(self):
+        # Runs while a generation is in flight. Without threaded Tcl it is the only wakeup;
+        # otherwise it is a slow safety net in case an <<ApiResult>> event is dropped.
+        self._poll_after_id = None
+        if not self._handle_api_result():
+            self._poll_after_id = self.root.after(1000 if self._tcl_threaded else 100, self._poll_api_queue)
+
+    def _handle_api_result(self, event=None):
+        # Messages are ("progress", done, total) tuples, then a final list of questions or an Exception.
+        # Returns True once the final message has been handled.
+        while True:
+            try:
+                result = self.api_queue.get_nowait()
+            except queue.Empty:
+                return False
+            if isinstance(result, tuple) and result[0] == "progress":
+                _, done, total = result
+                self.status_label.config(text=f"Generating... {done}/{total} generated.")
+                continue
+            if self._poll_after_id:
+                self.root.after_cancel(self._poll_after_id)
+                self._poll_after_id = None
             self.generate_button.config(state="normal")
             self.status_label.config(text="")
             if isinstance(result, Exception):
@@ -400,63 +664,90 @@ class QuizApp:
             else:
                 self.questions = result
                 self.start_quiz()
-        except queue.Empty:
-            self.root.after(100, self.check_api_queue)
+            return True
 
     def start_quiz(self):
         self.user_answers = []
         self.current_question_index = 0
         self.show_question_ui()
 
+    def build_question_screen(self):
+        screen = self._screens["question"]
+        self.question_header_label = ttk.Label(screen, style="Header.TLabel")
+        self.question_header_label.pack(pady=10)
+        ttk.Separator(screen).pack(fill="x", pady=5)
+        self.question_text_label = ttk.Label(screen, wraplength=700, justify="left")
+        self.question_text_label.pack(pady=10, anchor="w")
+
+        self.options_frame = ttk.Frame(screen, style="Main.TFrame")
+        self.options_frame.pack(fill="x", padx=20)
+        # Option rows are pooled across questions and only reconfigured.
+        self.option_rows = []
+        self.check_vars = {}
+        self.answer_var = tk.StringVar()
+
+        ttk.Button(screen, text="Submit Answer", command=self.submit_answer, style="Red.TButton").pack(pady=20)
+
     def show_question_ui(self):
-        for widget in self.main_frame.winfo_children():
-            widget.destroy()
+        if not self._screens["question"].winfo_children():
+            self.build_question_screen()
         q_data = self.questions[self.current_question_index]
         q_num = self.current_question_index + 1
         is_multiple_choice = len(q_data.get("answers", [])) > 1
 
-        ttk.Label(self.main_frame, text=f"Question {q_num} of {len(self.questions)}", style="Header.TLabel").pack(pady=10)
-        ttk.Separator(self.main_frame).pack(fill="x", pady=5)
-        ttk.Label(self.main_frame, text=q_data.get("question"), wraplength=700, justify="left").pack(pady=10, anchor="w")
-        
-        options_frame = ttk.Frame(self.main_frame, style="Main.TFrame")
-        options_frame.pack(fill="x", padx=20)
-
-        options = q_data.get("options", {})
-        if is_multiple_choice:
-            self.check_vars = {}
-            for key, value in options.items():
-                self.create_wrapped_option(options_frame, "check", key, value)
-        else:
-            self.answer_var = tk.StringVar()
-            for key, value in options.items():
-                self.create_wrapped_option(options_frame, "radio", key, value)
-
-        ttk.Button(self.main_frame, text="Submit Answer", command=self.submit_answer, style="Red.TButton").pack(pady=20)
-
-    def create_wrapped_option(self, parent, opt_type, key, value):
-        option_frame = ttk.Frame(parent, style="Main.TFrame")
-        option_frame.pack(fill="x", anchor="w", pady=2)
-
-        if opt_type == "check":
-            var = tk.BooleanVar()
-            self.check_vars[key] = var
-            button = ttk.Checkbutton(option_frame, variable=var)
-            button.pack(side="left", anchor="n", padx=(0, 5))
-        else: # radio
-            button = ttk.Radiobutton(option_frame, variable=self.answer_var, value=key)
-            button.pack(side="left", anchor="n", padx=(0, 5))
-
-        label = ttk.Label(option_frame, text=f"{key}. {value}", wraplength=650, justify="left")
-        label.pack(side="left", fill="x", expand=True)
+        self.question_header_label.config(text=f"Question {q_num} of {len(self.questions)}")
+        self.question_text_label.config(text=q_data.get("question"))
+
+        options = list(q_data.get("options", {}).items())
+        opt_type = "check" if is_multiple_choice else "radio"
+        self.check_vars = {}
+        self.answer_var.set("")
+        while len(self.option_rows) < len(options):
+            self.create_option_row()
+        for row, (key, value) in zip(self.option_rows, options):
+            self.configure_option_row(row, opt_type, key, value)
+        # Unused rows are always a suffix of the pool, so re-packing keeps the order.
+        for row in self.option_rows[len(options):]:
+            if row["shown"]:
+                row["frame"].pack_forget()
+                row["shown"] = False
+
+        self.show_screen("question")
+
+    def create_option_row(self):
+        row = {"type": None, "key": None, "shown": False, "var": tk.BooleanVar()}
+        row["frame"] = ttk.Frame(self.options_frame, style="Main.TFrame")
+        row["check"] = ttk.Checkbutton(row["frame"], variable=row["var"])
+        row["radio"] = ttk.Radiobutton(row["frame"], variable=self.answer_var)
+        row["label"] = ttk.Label(row["frame"], wraplength=650, justify="left")
+        row["label"].pack(side="left", fill="x", expand=True)
 
         def on_click(event):
-            if opt_type == "check":
-                var.set(not var.get())
+            if row["type"] == "check":
+                row["var"].set(not row["var"].get())
             else:
-                self.answer_var.set(key)
-        
-        label.bind("<Button-1>", on_click)
+                self.answer_var.set(row["key"])
+
+        row["label"].bind("<Button-1>", on_click)
+        self.option_rows.append(row)
+        return row
+
+    def configure_option_row(self, row, opt_type, key, value):
+        if row["type"] != opt_type:
+            if row["type"] is not None:
+                row[row["type"]].pack_forget()
+            row[opt_type].pack(side="left", anchor="n", padx=(0, 5), before=row["label"])
+            row["type"] = opt_type
+        row["key"] = key
+        if opt_type == "check":
+            row["var"].set(False)
+            self.check_vars[key] = row["var"]
+        else:
+            row["radio"].config(value=key)
+        row["label"].config(text=f"{key}. {value}")
+        if not row["shown"]:
+            row["frame"].pack(fill="x", anchor="w", pady=2)
+            row["shown"] = True
 
     def submit_answer(self):
         q_data = self.questions[self.current_question_index]
@@ -464,77 +755,81 @@ class QuizApp:
         if is_multiple_choice:
             selected_answers = sorted([key for key, var in self.check_vars.items() if var.get()])
             if not selected_answers: messagebox.showwarning("No Answer", "Please select at least one option."); return
-            self.user_answers.append(selected_answers)
         else:
             selected_answer = self.answer_var.get()
             if not selected_answer: messagebox.showwarning("No Answer", "Please select an option."); return
-            self.user_answers.append([selected_answer])
+            selected_answers = [selected_answer]
+        # Score now so show_results_ui only has to render.
+        correct_answers = sorted(q_data.get("answers", []))
+        self.user_answers.append({
+            "selected": selected_answers,
+            "correct": correct_answers,
+            "is_correct": selected_answers == correct_answers,
+        })
         self.current_question_index += 1
         if self.current_question_index < len(self.questions):
             self.show_question_ui()
         else:
             self.show_results_ui()
 
-    def show_results_ui(self):
-        for widget in self.main_frame.winfo_children():
-            widget.destroy()
-        
-        ttk.Label(self.main_frame, text="Quiz Results", style="Header.TLabel").pack(pady=10, fill="x")
+    def build_results_screen(self):
+        screen = self._screens["results"]
+        ttk.Label(screen, text="Quiz Results", style="Header.TLabel").pack(pady=10, fill="x")
 
-        summary_frame = ttk.Frame(self.main_frame, style="Main.TFrame")
+        summary_frame = ttk.Frame(screen, style="Main.TFrame")
         summary_frame.pack(side=tk.BOTTOM, fill="x", pady=10, padx=10)
-        
-        correct_count = 0
-        for i, q_data in enumerate(self.questions):
-            user_ans_list = self.user_answers[i]
-            correct_ans_list = sorted(q_data.get("answers", []))
-            if user_ans_list == correct_ans_list:
-                correct_count += 1
-
-        summary_text = f"Final Score: {correct_count} out of {len(self.questions)}"
-        ttk.Label(summary_frame, text=summary_text, font=(self.FONT_FAMILY, 14, "bold")).pack()
+        self.score_label = ttk.Label(summary_frame, font=(self.FONT_FAMILY, 14, "bold"))
+        self.score_label.pack()
         ttk.Button(summary_frame, text="Take Another Quiz", command=self.setup_ui, style="Red.TButton").pack(pady=10)
 
-        results_container = ttk.Frame(self.main_frame, style="Main.TFrame")
+        results_container = ttk.Frame(screen, style="Main.TFrame")
         results_container.pack(side=tk.TOP, fill="both", expand=True)
 
-        canvas = tk.Canvas(results_container, bg=self.BG_COLOR, highlightthickness=0)
-        scrollbar = ttk.Scrollbar(results_container, orient="vertical", command=canvas.yview)
-        scrollable_frame = ttk.Frame(canvas, style="Main.TFrame")
-        
-        canvas.configure(yscrollcommand=scrollbar.set)
-        canvas.pack(side="left", fill="both", expand=True)
+        # One Text widget with tagged ranges lays out every result in a single pass.
+        self.results_text = tk.Text(
+            results_container, wrap="word", bg=self.BG_COLOR, fg=self.TEXT_COLOR,
+            font=(self.FONT_FAMILY, 10), relief="flat", highlightthickness=0, padx=10, pady=5,
+        )
+        scrollbar = ttk.Scrollbar(results_container, orient="vertical", command=self.results_text.yview)
+        self.results_text.configure(yscrollcommand=scrollbar.set)
+        self.results_text.pack(side="left", fill="both", expand=True)
         scrollbar.pack(side="right", fill="y")
-        
-        canvas_frame_id = canvas.create_window((0, 0), window=scrollable_frame, anchor="nw")
 
-        def on_canvas_configure(event):
-            canvas.itemconfig(canvas_frame_id, width=event.width)
-        canvas.bind('<Configure>', on_canvas_configure)
+        self.results_text.tag_config("header_ok", foreground=self.SUCCESS_COLOR, font=(self.FONT_FAMILY, 11, "bold"), spacing1=10)
+        self.results_text.tag_config("header_bad", foreground=self.PRIMARY_COLOR, font=(self.FONT_FAMILY, 11, "bold"), spacing1=10)
+        self.results_text.tag_config("question", spacing1=5, spacing3=5)
+        self.results_text.tag_config("answer_ok", foreground=self.SUCCESS_COLOR)
+        self.results_text.tag_config("answer_bad", foreground=self.PRIMARY_COLOR)
+        self.results_text.tag_config("correct", foreground=self.SUCCESS_COLOR, spacing3=5)
+
+    def show_results_ui(self):
+        if not self._screens["results"].winfo_children():
+            self.build_results_screen()
+
+        correct_count = sum(record["is_correct"] for record in self.user_answers)
+        self.score_label.config(text=f"Final Score: {correct_count} out of {len(self.questions)}")
+
+        results_text = self.results_text
+        results_text.config(state="normal")
+        results_text.delete("1.0", "end")
+        for i, (q_data, record) in enumerate(zip(self.questions, self.user_answers)):
+            user_ans_list = record["selected"]
+            correct_ans_list = record["correct"]
+            is_correct = record["is_correct"]
 
-        for i, q_data in enumerate(self.questions):
-            user_ans_list = self.user_answers[i]
-            correct_ans_list = sorted(q_data.get("answers", []))
-            is_correct = user_ans_list == correct_ans_list
-            
             status = "[+] CORRECT" if is_correct else "[-] INCORRECT"
-            color = self.SUCCESS_COLOR if is_correct else self.PRIMARY_COLOR
-            
-            res_frame = ttk.LabelFrame(scrollable_frame, text=f"Question {i+1}: {status}")
-            res_frame.pack(fill="x", expand=True, padx=10, pady=5)
-            
-            ttk.Label(res_frame, text=q_data.get("question"), wraplength=600, justify="left").pack(anchor="w", pady=5, padx=5)
-            ttk.Label(res_frame, text=f"Your answer: {', '.join(user_ans_list)}", foreground=color).pack(anchor="w", padx=5)
-            
-            # --- THE FIX ---
             options = q_data.get("options", {})
             correct_answer_texts = [f"{ans}. {options.get(ans, 'N/A')}" for ans in correct_ans_list]
             full_correct_answer_str = "\n".join(correct_answer_texts)
-            
-            ttk.Label(res_frame, text=f"Correct answer(s):\n{full_correct_answer_str}", foreground=self.SUCCESS_COLOR, justify="left", wraplength=600).pack(anchor="w", padx=5, pady=(0, 5))
 
-        self.root.update_idletasks()
-        canvas.config(scrollregion=canvas.bbox("all"))
+            results_text.insert("end", f"Question {i+1}: {status}\n", "header_ok" if is_correct else "header_bad")
+            results_text.insert("end", f"{q_data.get('question')}\n", "question")
+            results_text.insert("end", f"Your answer: {', '.join(user_ans_list)}\n", "answer_ok" if is_correct else "answer_bad")
+            results_text.insert("end", f"Correct answer(s):\n{full_correct_answer_str}\n", "correct")
+
+        results_text.config(state="disabled")
+        results_text.yview_moveto(0)
+        self.show_screen("results")
 
 if __name__ == "__main__":
     root = tk.Tk()